@@ -25,6 +25,7 @@ from collections.abc import KeysView
 from collections.abc import Mapping
 from collections.abc import MutableMapping
 from collections.abc import Reversible
+from collections.abc import Sized
 from collections.abc import ValuesView
 from itertools import starmap
 from operator import eq
@@ -40,7 +41,6 @@ from ._exc import DuplicationError
 from ._exc import KeyAndValueDuplicationError
 from ._exc import KeyDuplicationError
 from ._exc import ValueDuplicationError
-from ._iter import inverted
 from ._iter import iteritems
 from ._typing import KT
 from ._typing import MISSING
@@ -218,7 +218,7 @@ class BidictBase(BidirectionalMapping[KT, VT]):
     def __repr__(self) -> str:
         """See :func:`repr`."""
         clsname = self.__class__.__name__
-        items = dict(self.items()) if self else ''
+        items = dict(self.items()) if self._fwdm else ''
         return f'{clsname}({items})'
 
     def values(self) -> BidictKeysView[VT]:
@@ -234,7 +234,8 @@ class BidictBase(BidirectionalMapping[KT, VT]):
 
         See :meth:`keys` for more information.
         """
-        return t.cast(BidictKeysView[VT], self.inverse.keys())
+        # Pass cast() a string so the generic alias isn't subscripted (which is slow) on every call.
+        return t.cast('BidictKeysView[VT]', self.inverse.keys())
 
     def keys(self) -> KeysView[KT]:
         """A set-like object providing a view on the contained keys.
@@ -294,6 +295,12 @@ class BidictBase(BidirectionalMapping[KT, VT]):
 
         *See also* :meth:`equals_order_sensitive`
         """
+        if self is other:
+            return True
+        # When both backing mappings are dicts, compare them directly, which is fastest.
+        # Other backing mapping types (e.g. OrderedDict) may have order-sensitive __eq__.
+        if isinstance(other, BidictBase) and type(self._fwdm) is dict and type(other._fwdm) is dict:
+            return self._fwdm == other._fwdm
         if isinstance(other, Mapping):
             return self._fwdm.items() == other.items()
         # Ref: https://docs.python.org/3/library/constants.html#NotImplemented
@@ -328,13 +335,18 @@ class BidictBase(BidirectionalMapping[KT, VT]):
         return *(oldkey, oldval)*.
         """
         fwdm, invm = self._fwdm, self._invm
-        oldval: OVT[VT] = fwdm.get(key, MISSING)
-        oldkey: OKT[KT] = invm.get(val, MISSING)
-        isdupkey, isdupval = oldval is not MISSING, oldkey is not MISSING
+        isdupkey, isdupval = key in fwdm, val in invm
+        if not isdupkey and not isdupval:
+            # Common case: neither key nor val duplicates an existing item, so there's nothing to look up.
+            return MISSING, MISSING
+        oldval: OVT[VT] = fwdm[key] if isdupkey else MISSING
+        oldkey: OKT[KT] = invm[val] if isdupval else MISSING
         if isdupkey and isdupval:
-            if key == oldkey:
-                assert val == oldval
+            # Check identity first, both because it's cheaper than calling __eq__, and so that
+            # objects that don't compare equal to themselves (e.g. NaN) are treated as in dicts.
+            if key is oldkey or key == oldkey:
                 # (key, val) duplicates an existing item -> no-op.
+                # (No need to also compare val with oldval: By our invariant, key == invm[val] implies fwdm[key] == val.)
                 return None
             # key and val each duplicate a different existing item.
             if on_dup.val is RAISE:
@@ -375,6 +387,11 @@ class BidictBase(BidirectionalMapping[KT, VT]):
         as changes are made.
         """
         fwdm, invm = self._fwdm, self._invm
+        if oldval is MISSING and oldkey is MISSING and unwrites is None:
+            # Fast path for the common case: Insert a new item with no duplication and no unwrites to record.
+            fwdm[newkey] = newval
+            invm[newval] = newkey
+            return
         fwdm_set, invm_set = fwdm.__setitem__, invm.__setitem__
         fwdm_del, invm_del = fwdm.__delitem__, invm.__delitem__
         # Always perform the following writes regardless of duplication.
@@ -436,15 +453,56 @@ class BidictBase(BidirectionalMapping[KT, VT]):
             on_dup = self.on_dup
         if rollback is None:
             rollback = RAISE in on_dup
-
-        # Fast path when we're empty and updating only from another bidict (i.e. no dup vals in new items).
-        if not self and not kw and isinstance(arg, BidictBase):
-            self._init_from(arg)
+        # Several of the paths below apply only when the input is a single mapping (and no kw), so check this just once.
+        argmap = arg if not kw and isinstance(arg, Mapping) else None
+
+        # Fast path when we're empty and updating only from a dict or another bidict (i.e. no dup keys in new items)
+        # with no dup vals either: Nothing needs to be deduplicated, so bulk-insert the new items all at once.
+        # This is much faster than inserting them one at a time, particularly when our backing mappings are dicts,
+        # which can then be presized and filled in C. Other mappings are excluded since reading their items could
+        # fail partway through the bulk insert (e.g. on an unhashable key), which would not fail clean.
+        # Since this bypasses _dedup, only take it for a dict if _dedup is not overridden.
+        # (Bulk-inserting from another bidict, e.g. as copy() does, has always bypassed _dedup.)
+        if (
+            argmap is not None
+            and not self._fwdm
+            and (
+                isinstance(argmap, BidictBase)
+                or (
+                    type(argmap) is dict
+                    and self.__class__._dedup is BidictBase._dedup
+                    and len(set(argmap.values())) == len(argmap)
+                )
+            )
+        ):
+            self._init_from(argmap)
             return
 
+        # Fast path when we're nonempty and updating only from a dict or another bidict whose items are all new,
+        # i.e. none of its keys or values are already contained, and its values are unique: Nothing needs to be
+        # deduplicated (so on_dup doesn't matter) and nothing can fail, so bulk-insert the new items all at once.
+        # Other mappings are excluded since their keys need not remain distinct once inserted into a dict.
+        # Since this bypasses both _dedup and _write, only take this path if neither is overridden (as _write is
+        # e.g. by OrderedBidictBase). The disjointness checks rely on dict's set-like keys views, so also only take
+        # this path if our backing mappings are dicts.
+        if (
+            argmap is not None
+            and (type(argmap) is dict or isinstance(argmap, BidictBase))
+            and self.__class__._dedup is BidictBase._dedup
+            and self.__class__._write is BidictBase._write
+            and type(self._fwdm) is dict is type(self._invm)
+            and self._fwdm.keys().isdisjoint(argmap)
+        ):
+            # A bidict's values are already unique, otherwise check uniqueness by collecting them into a set.
+            newvals = argmap.values() if isinstance(argmap, BidictBase) else set(argmap.values())
+            if len(newvals) == len(argmap) and self._invm.keys().isdisjoint(newvals):
+                self._fwdm.update(argmap)
+                self._invm.update(zip(argmap.values(), argmap.keys()))
+                return
+
         # Fast path when we're adding more items than we contain already and rollback is enabled:
         # Update a copy of self with rollback disabled. Fail if that fails, otherwise become the copy.
-        if rollback and isinstance(arg, t.Sized) and len(arg) + len(kw) > len(self):
+        if rollback and isinstance(arg, Sized) and len(arg) + len(kw) > len(self._fwdm):
             tmp = self.copy()
             tmp._update(arg, kw, rollback=False, on_dup=on_dup)
             self._init_from(tmp)
@@ -455,11 +513,14 @@ class BidictBase(BidirectionalMapping[KT, VT]):
         # perform on our backing _fwdm and _invm mappings. If rollback is enabled, also compute the associated unwrites
         # as we go. If the update results in a DuplicationError and rollback is enabled, apply the accumulated unwrites
         # before raising, to ensure that we fail clean.
-        write = self._write
+        dedup, write = self._dedup, self._write
         unwrites: Unwrites | None = [] if rollback else None
-        for key, val in iteritems(arg, **kw):
+        # When updating only from a mapping, iterate over its items directly rather than via iteritems(),
+        # to avoid the overhead of resuming a Python generator for each item.
+        items = argmap.items() if argmap is not None else iteritems(arg, **kw)
+        for key, val in items:
             try:
-                dedup_result = self._dedup(key, val, on_dup)
+                dedup_result = dedup(key, val, on_dup)
             except DuplicationError:
                 if unwrites is not None:
                     for fn, *args in reversed(unwrites):
@@ -495,10 +556,19 @@ class BidictBase(BidirectionalMapping[KT, VT]):
         """Fast init from *other*, bypassing item-by-item duplication checking."""
         self._fwdm.clear()
         self._invm.clear()
-        self._fwdm.update(other)
+        # If other is a bidict whose iteration order is that of its backing mappings,
+        # update from its backing mappings directly. When these are dicts, this lets
+        # dict.update() copy them in C, rather than calling other.__getitem__() per key.
+        if isinstance(other, BidictBase) and other.__class__.__iter__ is BidictBase.__iter__:
+            self._fwdm.update(other._fwdm)
+            self._invm.update(other._invm)
+            return
+        fwdm = self._fwdm
+        fwdm.update(other)
         # If other is a bidict, use its existing backing inverse mapping, otherwise
         # other could be a generator that's now exhausted, so invert self._fwdm on the fly.
-        inv = other.inverse if isinstance(other, BidictBase) else inverted(self._fwdm)
+        # Zipping its values with its keys does this without a Python-level generator.
+        inv = other.inverse if isinstance(other, BidictBase) else zip(fwdm.values(), fwdm.keys())
         self._invm.update(inv)
 
     # other's type is Mapping rather than Maplike since bidict() | SupportsKeysAndGetItem({})
@@ -534,14 +604,17 @@ class BidictBase(BidirectionalMapping[KT, VT]):
     def __reduce__(self) -> tuple[t.Any, ...]:
         """Return state information for pickling."""
         cls = self.__class__
-        inst: Mapping[t.Any, t.Any] = self
+        inst: BidictBase[t.Any, t.Any] = self
         # If this bidict's class is dynamically generated, pickle the inverse instead, whose (presumably not
         # dynamically generated) class the caller is more likely to have a reference to somewhere in sys.modules
         # that pickle can discover.
         if should_invert := isinstance(self, GeneratedBidictInverse):
             cls = self._inv_cls
             inst = self.inverse
-        return self._from_other, (cls, dict(inst), should_invert)
+        # If inst iterates in the order of its backing forward mapping, copy that directly rather than inst itself.
+        # When it's a dict, this copies it in C, rather than calling inst.__getitem__() for each key.
+        items = dict(inst._fwdm) if inst.__class__.__iter__ is BidictBase.__iter__ else dict(inst)
+        return self._from_other, (cls, items, should_invert)
 
 
 # See BidictBase._set_reversed() above.
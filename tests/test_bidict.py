@@ -16,6 +16,7 @@ import pickle
 import sys
 import typing as t
 import weakref
+from collections import OrderedDict
 from collections.abc import Callable
 from collections.abc import Mapping
 from collections.abc import Reversible
@@ -68,6 +69,7 @@ from bidict import OnDup
 from bidict import OnDupAction
 from bidict import OrderedBidict
 from bidict import ValueDuplicationError
+from bidict import bidict
 from bidict import frozenbidict
 from bidict import inverted
 from bidict._typing import MapOrItems
@@ -333,6 +335,28 @@ def test_eq_defers_to_other_eq(bi_t: BT[KT, VT]) -> None:
     assert bi_t() == ANY
 
 
+@given(items121=items121)
+def test_eq_across_bidict_types(items121: Items121) -> None:
+    """Bidicts of different types (and with different backing mapping types) compare equal given the same items."""
+    bis = [bi_t(items121) for bi_t in bidict_types]
+    for b1, b2 in product(bis, repeat=2):
+        assert b1 == b2
+        assert b1.inv == b2.inv
+
+
+def test_eq_order_insensitive_with_ordered_backing_mappings() -> None:
+    """Bidicts backed by mappings with order-sensitive __eq__ (e.g. OrderedDict) still compare order-insensitively."""
+
+    class OrderedDictBackedBidict(bidict[int, int]):
+        _fwdm_cls = _invm_cls = OrderedDict
+
+    b1, b2 = OrderedDictBackedBidict({1: 2, 3: 4}), OrderedDictBackedBidict({3: 4, 1: 2})
+    assert b1 == b2
+    assert b1.inv == b2.inv
+    assert b1 == bidict(b2)
+    assert bidict(b1) == b2
+
+
 @pytest.mark.parametrize(('bi_t', 'non_mapping'), product(bidict_types, (None, 1, [], SupportsKeysAndGetItem({}))))
 def test_eq_and_or_with_non_mapping(bi_t: BT[KT, VT], non_mapping: t.Any) -> None:
     bi = bi_t()
@@ -392,6 +416,78 @@ def test_putall_matches_bulk_put(bi_t: type[MutableBidict[int, int]], on_dup: On
             assert_putall_matches_bulk_put(b, [(k1, v1), (k2, v2)], on_dup)
 
 
+@pytest.mark.parametrize(('bi_t', 'on_dup'), product(mutable_bidict_types, on_dups))
+def test_put_existing_item_not_equal_to_itself(bi_t: type[MutableBidict[t.Any, t.Any]], on_dup: OnDup) -> None:
+    """Re-putting an existing item whose key or value != itself (e.g. NaN) is a no-op, as with dict."""
+    nan = float('nan')
+    for items in ((nan, 1), (1, nan)), ((nan, nan),):
+        bi = bi_t(items)
+        for key, val in items:
+            bi.put(key, val, on_dup)
+            bi.putall([(key, val)], on_dup)
+        assert list(bi.items()) == list(items)
+
+
+class ItemsListMapping(Mapping[t.Any, t.Any]):
+    """A mapping backed by a list of items and keyed by identity.
+
+    It therefore supports unhashable keys, as well as distinct keys that would collide in a dict (e.g. 1 and 1.0).
+    """
+
+    def __init__(self, *items: tuple[t.Any, t.Any]) -> None:
+        self._items = items
+
+    def __getitem__(self, key: t.Any) -> t.Any:
+        for k, v in self._items:
+            if k is key:
+                return v
+        raise KeyError(key)
+
+    def __iter__(self) -> t.Iterator[t.Any]:
+        return (k for k, _ in self._items)
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+
+@pytest.mark.parametrize('bi_t', mutable_bidict_types)
+def test_update_empty_from_failing_mapping_fails_clean(bi_t: type[MutableBidict[t.Any, t.Any]]) -> None:
+    """Updating an empty bidict from a mapping whose items can't all be inserted leaves it empty."""
+    bi = bi_t()
+    with pytest.raises(TypeError):
+        bi.putall(ItemsListMapping((1, 'a'), ([2], 'b')))
+    assert len(bi) == len(bi.inv) == 0
+    assert list(bi) == list(bi.inv) == []
+
+
+@pytest.mark.parametrize('bi_t', mutable_bidict_types)
+def test_update_from_mapping_with_keys_colliding_in_dict(bi_t: type[MutableBidict[t.Any, t.Any]]) -> None:
+    """Updating from a mapping whose distinct keys collide once inserted into a dict keeps fwd and inv in sync."""
+    for init in {}, {0: 'z'}:
+        bi = bi_t(init)
+        bi.update(ItemsListMapping((1, 'a'), (1.0, 'b')))
+        assert len(bi) == len(bi.inv) == len(init) + 1
+        assert dict(bi.inv) == {v: k for k, v in bi.items()}
+
+
+class NoNoneBidict(bidict[t.Any, t.Any]):
+    """A bidict that overrides :meth:`~bidict.BidictBase._dedup` to reject None values."""
+
+    def _dedup(self, key: t.Any, val: t.Any, on_dup: OnDup) -> t.Any:
+        if val is None:
+            raise ValueError('None values are not allowed')
+        return super()._dedup(key, val, on_dup)
+
+
+@pytest.mark.parametrize('init', [{}, {0: 1}])
+def test_update_respects_overridden_dedup(init: dict[int, int]) -> None:
+    """Bulk updates (into an empty or nonempty bidict) don't bypass an overridden _dedup."""
+    bi = NoNoneBidict(init)
+    with pytest.raises(ValueError, match='None values'):
+        bi.update({2: None})
+    assert bi == init
+
+
 def assert_putall_matches_bulk_put(bi: MutableBidict[int, int], new_items: Items, on_dup: OnDup) -> None:
     tmp = bi.copy()
     checkexc = None
@@ -469,6 +565,23 @@ skip_if_pypy = pytest.mark.skipif(
 )
 
 
+class WeakrefBidict(MutableBidict[t.Any, t.Any]):
+    """The ``WeakrefBidict`` recipe from docs/extending.rst, whose backing mappings' keys() are not set-like."""
+
+    _fwdm_cls = weakref.WeakKeyDictionary
+    _invm_cls = weakref.WeakValueDictionary
+
+
+def test_weakref_bidict_update_from_mapping() -> None:
+    """Updating a nonempty bidict with non-dict backing mappings from a mapping of all-new items works."""
+    o0, o1, o2, o3 = (frozenset({i}) for i in range(4))
+    b = WeakrefBidict()
+    b[o0] = o1
+    b.update({o2: o3})
+    assert dict(b) == {o0: o1, o2: o3}
+    assert dict(b.inv) == {o1: o0, o3: o2}
+
+
 @skip_if_pypy
 @given(bidict_t=bidict_t)
 def test_bidicts_freed_on_zero_refcount(bidict_t: BT[KT, VT]) -> None: